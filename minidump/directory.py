@@ -1,7 +1,12 @@
 
+import struct
+
 from minidump.constants import MINIDUMP_STREAM_TYPE
 from minidump.common_structs import MINIDUMP_LOCATION_DESCRIPTOR
 
+# StreamType, Location.DataSize, Location.Rva
+_DIR_STRUCT = struct.Struct('<III')
+
 class MINIDUMP_DIRECTORY:
 	def __init__(self):
 		self.StreamType = None
@@ -34,6 +39,39 @@ class MINIDUMP_DIRECTORY:
 		md.Location = MINIDUMP_LOCATION_DESCRIPTOR.parse(buff)
 		return md
 
+	@staticmethod
+	def from_values(raw_stream_type_value, data_size, rva):
+		"""
+		Builds the directory entry from already unpacked values, returns None for ignored user streams
+		"""
+		# plain dict lookup instead of going through the enum constructor
+		stream_type = MINIDUMP_STREAM_TYPE._value2member_map_.get(raw_stream_type_value)
+		if stream_type is None:
+			# see parse() on why user streams are ignored
+			if raw_stream_type_value > MINIDUMP_STREAM_TYPE.LastReservedStream.value:
+				return None
+			stream_type = MINIDUMP_STREAM_TYPE(raw_stream_type_value) # raises ValueError, same as parse()
+
+		md = MINIDUMP_DIRECTORY()
+		md.StreamType = stream_type
+		md.Location = MINIDUMP_LOCATION_DESCRIPTOR()
+		md.Location.DataSize = data_size
+		md.Location.Rva = rva
+		return md
+
+	@staticmethod
+	def parse_table(buf, offset, count):
+		"""
+		Parses count consecutive directory entries starting at offset from an object supporting the buffer protocol, in one pass.
+		Returns a list of (raw stream type value, MINIDUMP_DIRECTORY or None for ignored user streams) tuples
+		"""
+		table = buf[offset:offset + count * _DIR_STRUCT.size]
+		table = table[:len(table) - len(table) % _DIR_STRUCT.size] # truncated file, keep the complete entries
+		return [
+			(raw_stream_type_value, MINIDUMP_DIRECTORY.from_values(raw_stream_type_value, data_size, rva))
+			for raw_stream_type_value, data_size, rva in _DIR_STRUCT.iter_unpack(table)
+		]
+
 	@staticmethod
 	async def aparse(buff):
 
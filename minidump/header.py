@@ -1,6 +1,10 @@
 from minidump.constants import MINIDUMP_TYPE
 from minidump.exceptions import MinidumpHeaderFlagsException, MinidumpHeaderSignatureMismatchException
 import io
+import struct
+
+# Signature, Version, ImplementationVersion, NumberOfStreams, StreamDirectoryRva, CheckSum, Reserved, TimeDateStamp, Flags
+_HEADER_STRUCT = struct.Struct('<4sHHIIIIII')
 
 # https://msdn.microsoft.com/en-us/library/windows/desktop/ms680378(v=vs.85).aspx
 class MinidumpHeader:
@@ -48,6 +52,28 @@ class MinidumpHeader:
 
 		return mh
 
+	@staticmethod
+	def parse_from(buff, offset = 0):
+		"""
+		Parses the header with a single unpack from an object supporting the buffer protocol (eg. mmap)
+		"""
+		if len(buff) - offset < _HEADER_STRUCT.size:
+			# truncated input, the legacy parser reports it the same way as with a file handle
+			return MinidumpHeader.parse(io.BytesIO(buff[offset:offset + _HEADER_STRUCT.size]))
+
+		mh = MinidumpHeader()
+		signature, mh.Version, mh.ImplementationVersion, mh.NumberOfStreams, mh.StreamDirectoryRva, \
+			mh.CheckSum, mh.Reserved, mh.TimeDateStamp, flags = _HEADER_STRUCT.unpack_from(buff, offset)
+		mh.Signature = signature.decode()[::-1]
+		if mh.Signature != 'PMDM':
+			raise MinidumpHeaderSignatureMismatchException(mh.Signature)
+		try:
+			mh.Flags = MINIDUMP_TYPE(flags)
+		except Exception as e:
+			raise MinidumpHeaderFlagsException('Could not parse header flags!')
+
+		return mh
+
 	@staticmethod
 	async def aparse(abuff):
 		adata = await abuff.read(32)
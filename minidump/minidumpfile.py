@@ -5,10 +5,14 @@
 #
 
 import io
+import os
 import sys
+import mmap
 import enum
 import struct
 import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
 
 from minidump.header import MinidumpHeader
 from minidump.minidumpreader import MinidumpFileReader
@@ -18,56 +22,249 @@ from minidump.constants import MINIDUMP_STREAM_TYPE, OFFSETS, POINTER_SIZE
 from minidump.directory import MINIDUMP_DIRECTORY
 from minidump.streams.SystemInfoStream import PROCESSOR_ARCHITECTURE
 
+logger = logging.getLogger(__name__)
+
+# precompiled little-endian unpackers used when walking the PEB
+_U64 = struct.Struct('<Q')
+_U32 = struct.Struct('<I')
+_U16 = struct.Struct('<H')
+_U8 = struct.Struct('<B')
+
+# number of bytes needed to cover every field we pull out of the PEB / process parameters, per architecture
+_PEB_READ_SIZE = [
+	max(off["being_debugged"] + 1, off["image_base_address"] + ptr_size, off["process_parameters"] + ptr_size)
+	for off, ptr_size in zip(OFFSETS, POINTER_SIZE)
+]
+_PROCESS_PARAMETERS_READ_SIZE = [
+	max(
+		max(off[name] + off["buffer"] + ptr_size for name in ("image_path", "command_line", "window_title", "dll_path", "current_directory")),
+		max(off[name] + ptr_size for name in ("standard_input", "standard_output", "standard_error", "environment_variables")),
+	)
+	for off, ptr_size in zip(OFFSETS, POINTER_SIZE)
+]
+
+# the environment block is usually a few KiB, try this much before reading the whole segment tail
+_ENV_BLOCK_READ_SIZE = 32 * 1024
+
+def _find_environment_block_end(env_block, start = 0):
+	"""
+	The environment block is a list of NUL terminated UTF-16 strings closed by an empty string.
+	Returns the offset of the char aligned double NUL closing the block (0 for an empty block), -1 if it's not in env_block.
+	The buffer is scanned once from start (an even offset), each search resumes where the previous (misaligned) match was found.
+	"""
+	if start == 0 and env_block[:2] == b"\x00\x00":
+		return 0
+	env_end = env_block.find(b"\x00\x00\x00\x00", start)
+	while env_end != -1 and env_end & 1:
+		env_end = env_block.find(b"\x00\x00\x00\x00", env_end + 1)
+	return env_end
+
+def _parse_environment_block(env_block, env_end):
+	"""
+	Decodes and splits the whole environment block at once, so all the byte scanning happens in bytes.find/str.split.
+	env_end is the terminator offset returned by _find_environment_block_end for env_block.
+	"""
+	if env_end == 0:
+		return []
+	if env_end == -1:
+		# no terminator in this segment, drop the last (truncated) entry
+		entries = env_block[:len(env_block) & ~1].decode("utf-16-le").split("\x00")[:-1]
+	else:
+		entries = env_block[:env_end].decode("utf-16-le").split("\x00")
+
+	environment_variables = []
+	for entry in entries:
+		# hidden per-drive entries like "=C:=C:\" start with the separator, it's part of the name there
+		sep = entry.find("=", 1)
+		if sep == -1:
+			environment_variables.append({"name": entry, "value": ""})
+		else:
+			environment_variables.append({"name": entry[:sep], "value": entry[sep + 1:]})
+	return environment_variables
+
+def _stream_property(attr_name):
+	"""
+	Stream attributes are parsed from their directory on first access, then cached
+	"""
+	def getter(self):
+		if attr_name not in self._streams:
+			self._streams[attr_name] = self._parse_stream(attr_name)
+		return self._streams[attr_name]
+
+	def setter(self, value):
+		self._streams[attr_name] = value
+
+	return property(getter, setter)
+
+def _peb_property(attr_name):
+	"""
+	PEB attributes are read from the dump memory on first access of any of them, then cached
+	"""
+	def getter(self):
+		if attr_name not in self._peb:
+			self._load_peb()
+		return self._peb[attr_name]
+
+	def setter(self, value):
+		self._peb[attr_name] = value
+
+	return property(getter, setter)
 
 class MinidumpFile:
+	# stream type -> (attribute name, parser)
+	_STREAM_PARSERS = {
+		MINIDUMP_STREAM_TYPE.ThreadListStream : ('threads', MinidumpThreadList.parse),
+		MINIDUMP_STREAM_TYPE.ModuleListStream : ('modules', MinidumpModuleList.parse),
+		MINIDUMP_STREAM_TYPE.MemoryListStream : ('memory_segments', MinidumpMemoryList.parse),
+		MINIDUMP_STREAM_TYPE.SystemInfoStream : ('sysinfo', MinidumpSystemInfo.parse),
+		MINIDUMP_STREAM_TYPE.ThreadExListStream : ('threads_ex', MinidumpThreadExList.parse),
+		MINIDUMP_STREAM_TYPE.Memory64ListStream : ('memory_segments_64', MinidumpMemory64List.parse),
+		MINIDUMP_STREAM_TYPE.CommentStreamA : ('comment_a', CommentStreamA.parse),
+		MINIDUMP_STREAM_TYPE.CommentStreamW : ('comment_w', CommentStreamW.parse),
+		MINIDUMP_STREAM_TYPE.ExceptionStream : ('exception', ExceptionList.parse),
+		MINIDUMP_STREAM_TYPE.HandleDataStream : ('handles', MinidumpHandleDataStream.parse),
+		MINIDUMP_STREAM_TYPE.UnloadedModuleListStream : ('unloaded_modules', MinidumpUnloadedModuleList.parse),
+		MINIDUMP_STREAM_TYPE.MiscInfoStream : ('misc_info', MinidumpMiscInfo.parse),
+		MINIDUMP_STREAM_TYPE.MemoryInfoListStream : ('memory_info', MinidumpMemoryInfoList.parse),
+		MINIDUMP_STREAM_TYPE.ThreadInfoListStream : ('thread_info', MinidumpThreadInfoList.parse),
+	}
+
+	# Reserved. Do not use these enumeration values.
+	_IGNORED_STREAMS = frozenset([
+		MINIDUMP_STREAM_TYPE.UnusedStream,
+		MINIDUMP_STREAM_TYPE.ReservedStream0,
+		MINIDUMP_STREAM_TYPE.ReservedStream1,
+	])
+
+	# known streams we don't have a parser for (yet)
+	_UNIMPLEMENTED_STREAMS = frozenset([
+		MINIDUMP_STREAM_TYPE.FunctionTableStream,
+		MINIDUMP_STREAM_TYPE.SystemMemoryInfoStream,
+		MINIDUMP_STREAM_TYPE.JavaScriptDataStream,
+		MINIDUMP_STREAM_TYPE.ProcessVmCountersStream,
+		MINIDUMP_STREAM_TYPE.TokenStream,
+	])
+
 	def __init__(self):
 		self.filename = None
 		self.file_handle = None
+		self.raw_file_handle = None
+		self.eager = False
+		self.max_workers = 1
 		self.header = None
 		self.directories = []
 
-		self.threads_ex = None
-		self.threads = None
-		self.modules = None
-		self.memory_segments = None
-		self.memory_segments_64 = None
-		self.sysinfo = None
-		self.comment_a = None
-		self.comment_w = None
-		self.exception = None
-		self.handles = None
-		self.unloaded_modules = None
-		self.misc_info = None
-		self.memory_info = None
-		self.thread_info = None
+		self._streams = {} # attribute name -> parsed stream
+		self._stream_directories = {} # attribute name -> MINIDUMP_DIRECTORY
+		self._peb = {} # attribute name -> value read from the PEB
+		self._x64 = None
+
+	threads_ex = _stream_property('threads_ex')
+	threads = _stream_property('threads')
+	modules = _stream_property('modules')
+	memory_segments = _stream_property('memory_segments')
+	memory_segments_64 = _stream_property('memory_segments_64')
+	sysinfo = _stream_property('sysinfo')
+	comment_a = _stream_property('comment_a')
+	comment_w = _stream_property('comment_w')
+	exception = _stream_property('exception')
+	handles = _stream_property('handles')
+	unloaded_modules = _stream_property('unloaded_modules')
+	misc_info = _stream_property('misc_info')
+	memory_info = _stream_property('memory_info')
+	thread_info = _stream_property('thread_info')
+
+	@property
+	def x64(self):
+		if self._x64 is None:
+			self._x64 = self.__detect_x64()
+		return self._x64
+
+	@x64.setter
+	def x64(self, value):
+		self._x64 = value
+
+	peb_address = _peb_property('peb_address')
+	being_debugged = _peb_property('being_debugged')
+	image_base_address = _peb_property('image_base_address')
+	image_path = _peb_property('image_path')
+	command_line = _peb_property('command_line')
+	window_title = _peb_property('window_title')
+	dll_path = _peb_property('dll_path')
+	current_directory = _peb_property('current_directory')
+	standard_input = _peb_property('standard_input')
+	standard_output = _peb_property('standard_output')
+	standard_error = _peb_property('standard_error')
+	environment_variables = _peb_property('environment_variables')
 
 	@staticmethod
-	def parse(filename):
+	def parse(filename, max_workers = 1, eager = False):
+		"""
+		By default streams (and the PEB) are only parsed when their attribute is first accessed,
+		eager: parse every stream and the PEB up-front
+		max_workers: when bigger than 1 the streams are parsed concurrently by this many threads,
+		each of them reading the file through its own handle. Requires eager.
+		"""
+		if max_workers > 1 and not eager:
+			raise ValueError('max_workers > 1 requires eager = True, lazy parsing reads streams on first access')
 		mf = MinidumpFile()
 		mf.filename = filename
-		mf.file_handle = open(filename, 'rb')
-		mf._parse()
+		mf.eager = eager
+		mf.max_workers = max_workers
+		mf.raw_file_handle = open(filename, 'rb')
+		if os.fstat(mf.raw_file_handle.fileno()).st_size == 0:
+			# empty files can't be mapped, let the header parser reject it
+			mf.file_handle = mf.raw_file_handle
+		else:
+			mf.file_handle = mmap.mmap(mf.raw_file_handle.fileno(), 0, access = mmap.ACCESS_READ)
+		try:
+			mf._parse()
+		except:
+			mf.close()
+			raise
 		return mf
 
 	@staticmethod
-	def parse_external(file_handle, filename = ''):
+	def parse_external(file_handle, filename = '', eager = False):
 		"""
 		External file handle must be an object that exposes basic file IO functionality
 		that you'd get by python's file buffer (read, seek, tell etc.)
+		Unless eager is set the handle must stay open, streams are parsed on first access.
 		"""
 		mf = MinidumpFile()
 		mf.filename = filename
+		mf.eager = eager
 		mf.file_handle = file_handle
 		mf._parse()
 		return mf
 
 	@staticmethod
-	def parse_bytes(data):
-		return MinidumpFile.parse_buff(io.BytesIO(data))
+	def parse_mmap(mm, filename = '', eager = False):
+		"""
+		Parses a minidump from an already memory-mapped file (mmap.mmap object).
+		The caller is responsible for keeping the mapping open while the object is used.
+		"""
+		mf = MinidumpFile()
+		mf.filename = filename
+		mf.eager = eager
+		mf.file_handle = mm
+		mf._parse()
+		return mf
+
+	@staticmethod
+	def parse_bytes(data, eager = False):
+		"""
+		Unless eager is set the data is kept referenced, streams are parsed on first access.
+		"""
+		return MinidumpFile.parse_buff(io.BytesIO(data), eager = eager)
 
 	@staticmethod
-	def parse_buff(buffer):
+	def parse_buff(buffer, eager = False):
+		"""
+		Unless eager is set the buffer must stay open, streams are parsed on first access.
+		"""
 		mf = MinidumpFile()
+		mf.eager = eager
 		mf.file_handle = buffer
 		mf._parse()
 		return mf
@@ -75,87 +272,123 @@ class MinidumpFile:
 	def get_reader(self):
 		return MinidumpFileReader(self)
 
+	def close(self):
+		"""
+		Releases the mapping and the file opened by parse(). Handles passed in by the caller are left open.
+		"""
+		if self.raw_file_handle is None:
+			return
+		if self.file_handle is not self.raw_file_handle:
+			self.file_handle.close()
+		self.raw_file_handle.close()
+		self.raw_file_handle = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc, tb):
+		self.close()
+
 	def _parse(self):
 		self.__parse_header()
 		self.__parse_directories()
+		if self.eager:
+			self.__parse_peb()
+
+	def _load_peb(self):
 		self.__parse_peb()
 
-	def __read_unicode_string_property(self, buff_reader, addr, x64):
-		buff_reader.move(addr)
-		string_length = int.from_bytes(buff_reader.read(2), "little")
+	def __read_unicode_string_property(self, buff_reader, blob, offset, off, unpack_ptr):
+		string_length = _U16.unpack_from(blob, offset)[0]
 		if not string_length:
 			return ""
-		buff_reader.move(addr + OFFSETS[x64]["buffer"])
-		buff_va = int.from_bytes(buff_reader.read(POINTER_SIZE[x64]), "little")
+		buff_va = unpack_ptr(blob, offset + off["buffer"])[0]
 		buff_reader.move(buff_va)
-		return buff_reader.read(string_length).decode("utf-16")
+		return buff_reader.read(string_length).decode("utf-16-le")
+
+	def __detect_x64(self):
+		# a Memory64ListStream is only written for 64 bit processes, no need to parse it to know
+		if 'memory_segments_64' in self._stream_directories:
+			return True
+		segments = self.memory_segments.memory_segments if self.memory_segments else ()
+		return bool(segments) and max(map(operator.attrgetter('start_virtual_address'), segments)) > 0xFFFFFFFF
 
 	def __parse_peb(self):
-		self.x64 = (self.memory_segments_64 is not None) or (self.memory_segments and  any(mem.start_virtual_address > 0xFFFFFFFF for mem in self.memory_segments))
-		offset_index = self.x64
+		x64 = self.x64
+		off = OFFSETS[x64]
+		ptr = _U64 if x64 else _U32
+		unpack_ptr = ptr.unpack_from
+		unpack_u8 = _U8.unpack_from
 
 		reader = self.get_reader()
 		buff_reader = reader.get_buffered_reader()
+		get_memoryview = buff_reader.get_memoryview
+		read_string = self.__read_unicode_string_property
 
-		buff_reader.move(self.threads.threads[0].Teb + OFFSETS[offset_index]["peb"])
+		# only publish the results once the whole walk succeeded, a failing walk fails the same way on every access
+		values = {}
 
-		self.peb_address = int.from_bytes(buff_reader.read(POINTER_SIZE[self.x64]), "little")
+		values["peb_address"] = unpack_ptr(get_memoryview(self.threads.threads[0].Teb + off["peb"], ptr.size))[0]
 
-		buff_reader.move(self.peb_address + OFFSETS[offset_index]["being_debugged"])
-		self.being_debugged = int.from_bytes(buff_reader.read(1), "little")
+		# the PEB and the process parameters are small, view each of them in one go
+		peb = get_memoryview(values["peb_address"], _PEB_READ_SIZE[x64])
 
-		buff_reader.move(self.peb_address + OFFSETS[offset_index]["image_base_address"])
-		self.image_base_address = int.from_bytes(buff_reader.read(POINTER_SIZE[self.x64]), "little")
+		values["being_debugged"] = unpack_u8(peb, off["being_debugged"])[0]
+		values["image_base_address"] = unpack_ptr(peb, off["image_base_address"])[0]
+		process_parameters = unpack_ptr(peb, off["process_parameters"])[0]
 
-		buff_reader.move(self.peb_address + OFFSETS[offset_index]["process_parameters"])
-		process_parameters = int.from_bytes(buff_reader.read(POINTER_SIZE[self.x64]), "little")
+		params = get_memoryview(process_parameters, _PROCESS_PARAMETERS_READ_SIZE[x64])
 
-		self.image_path = self.__read_unicode_string_property(
-			buff_reader, process_parameters + OFFSETS[offset_index]["image_path"], self.x64
+		values["image_path"] = read_string(
+			buff_reader, params, off["image_path"], off, unpack_ptr
 		)
 
-		self.command_line = self.__read_unicode_string_property(
-			buff_reader, process_parameters + OFFSETS[offset_index]["command_line"], self.x64
+		values["command_line"] = read_string(
+			buff_reader, params, off["command_line"], off, unpack_ptr
 		)
 
-		self.window_title = self.__read_unicode_string_property(
-			buff_reader, process_parameters + OFFSETS[offset_index]["window_title"], self.x64
+		values["window_title"] = read_string(
+			buff_reader, params, off["window_title"], off, unpack_ptr
 		)
 
-		self.dll_path = self.__read_unicode_string_property(buff_reader, process_parameters + OFFSETS[offset_index]["dll_path"],
-												self.x64)
-
-		self.current_directory = self.__read_unicode_string_property(
-			buff_reader, process_parameters + OFFSETS[offset_index]["current_directory"], self.x64
+		values["dll_path"] = read_string(
+			buff_reader, params, off["dll_path"], off, unpack_ptr
 		)
 
-		buff_reader.move(process_parameters + OFFSETS[offset_index]["standard_input"])
-		self.standard_input = int.from_bytes(buff_reader.read(POINTER_SIZE[self.x64]), "little")
-
-		buff_reader.move(process_parameters + OFFSETS[offset_index]["standard_output"])
-		self.standard_output = int.from_bytes(buff_reader.read(POINTER_SIZE[self.x64]), "little")
+		values["current_directory"] = read_string(
+			buff_reader, params, off["current_directory"], off, unpack_ptr
+		)
 
-		buff_reader.move(process_parameters + OFFSETS[offset_index]["standard_error"])
-		self.standard_error = int.from_bytes(buff_reader.read(POINTER_SIZE[self.x64]), "little")
+		values["standard_input"] = unpack_ptr(params, off["standard_input"])[0]
+		values["standard_output"] = unpack_ptr(params, off["standard_output"])[0]
+		values["standard_error"] = unpack_ptr(params, off["standard_error"])[0]
 
 		# Parse Environment Variables from PEB
-		self.environment_variables = []
-		buff_reader.move(process_parameters + OFFSETS[offset_index]["environment_variables"])
-		environment_va = int.from_bytes(buff_reader.read(POINTER_SIZE[self.x64]), "little")
+		environment_va = unpack_ptr(params, off["environment_variables"])[0]
 		buff_reader.move(environment_va)
 
-		env_buffer = buff_reader.read(buff_reader.current_segment.end_address - buff_reader.current_position)
-		while (env_len := env_buffer.find(b"\x00\x00")) and (env_len != -1):
-			decoded_env = (env_buffer[:env_len] + b"\x00").decode("utf-16")
-			name = decoded_env.split("=")[0]
-			value = decoded_env.split("=")[1]
-			self.environment_variables.append({"name": name, "value": value})
-			environment_va += (len(decoded_env) + 1) * 2
-			buff_reader.move(environment_va)
-			env_buffer = buff_reader.read(buff_reader.current_segment.end_address - buff_reader.current_position)
+		env_size = buff_reader.current_segment.end_address - buff_reader.current_position
+		env_block = buff_reader.read(min(env_size, _ENV_BLOCK_READ_SIZE))
+		env_end = _find_environment_block_end(env_block)
+		if env_end == -1 and env_size > _ENV_BLOCK_READ_SIZE:
+			env_block += buff_reader.read(env_size - _ENV_BLOCK_READ_SIZE)
+			# the first window had no terminator, only one straddling its end can still start before it
+			env_end = _find_environment_block_end(env_block, max(0, _ENV_BLOCK_READ_SIZE - 3) & ~1)
+		values["environment_variables"] = _parse_environment_block(env_block, env_end)
+		self._peb.update(values)
 
 
 	def __parse_header(self):
+		if isinstance(self.file_handle, mmap.mmap):
+			self.header = MinidumpHeader.parse_from(self.file_handle)
+			# the directory table is contiguous in the mapping, unpack it in one go
+			for raw_stream_type_value, minidump_dir in MINIDUMP_DIRECTORY.parse_table(self.file_handle, self.header.StreamDirectoryRva, self.header.NumberOfStreams):
+				if minidump_dir:
+					self.directories.append(minidump_dir)
+				else:
+					logger.debug('Found Unknown UserStream directory Type: %x', raw_stream_type_value)
+			return
+
 		self.header = MinidumpHeader.parse(self.file_handle)
 		for i in range(0, self.header.NumberOfStreams):
 			self.file_handle.seek(self.header.StreamDirectoryRva + i * 12, 0 )
@@ -166,151 +399,95 @@ class MinidumpFile:
 			else:
 				self.file_handle.seek(self.header.StreamDirectoryRva + i * 12, 0 )
 				user_stream_type_value = MINIDUMP_DIRECTORY.get_stream_type_value(self.file_handle)
-				logging.debug('Found Unknown UserStream directory Type: %x' % (user_stream_type_value))
+				logger.debug('Found Unknown UserStream directory Type: %x', user_stream_type_value)
 
 	def __parse_directories(self):
-
+		debug = logger.isEnabledFor(logging.DEBUG)
+		jobs = []
 		for dir in self.directories:
-			if dir.StreamType == MINIDUMP_STREAM_TYPE.UnusedStream:
-				logging.debug('Found UnusedStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				continue # Reserved. Do not use this enumeration value.
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ReservedStream0:
-				logging.debug('Found ReservedStream0 @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				continue # Reserved. Do not use this enumeration value.
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ReservedStream1:
-				logging.debug('Found ReservedStream1 @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
+			if debug:
+				logger.debug('Found %s @%x Size: %d', dir.StreamType.name, dir.Location.Rva, dir.Location.DataSize)
+
+			entry = self._STREAM_PARSERS.get(dir.StreamType)
+			if entry is not None:
+				self._stream_directories[entry[0]] = dir
+				jobs.append((dir, entry))
+			elif dir.StreamType in self._IGNORED_STREAMS:
 				continue # Reserved. Do not use this enumeration value.
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ThreadListStream:
-				logging.debug('Found ThreadListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.threads = MinidumpThreadList.parse(dir, self.file_handle)
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ModuleListStream:
-				logging.debug('Found ModuleListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.modules = MinidumpModuleList.parse(dir, self.file_handle)
-				#logging.debug(str(modules_list))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.MemoryListStream:
-				logging.debug('Found MemoryListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.memory_segments = MinidumpMemoryList.parse(dir, self.file_handle)
-				#logging.debug(str(self.memory_segments))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.SystemInfoStream:
-				logging.debug('Found SystemInfoStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.sysinfo = MinidumpSystemInfo.parse(dir, self.file_handle)
-				#logging.debug(str(self.sysinfo))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ThreadExListStream:
-				logging.debug('Found ThreadExListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.threads_ex = MinidumpThreadExList.parse(dir, self.file_handle)
-				#logging.debug(str(self.threads_ex))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.Memory64ListStream:
-				logging.debug('Found Memory64ListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.memory_segments_64 = MinidumpMemory64List.parse(dir, self.file_handle)
-				#logging.debug(str(self.memory_segments_64))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.CommentStreamA:
-				logging.debug('Found CommentStreamA @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.comment_a = CommentStreamA.parse(dir, self.file_handle)
-				#logging.debug(str(self.comment_a))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.CommentStreamW:
-				logging.debug('Found CommentStreamW @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.comment_w = CommentStreamW.parse(dir, self.file_handle)
-				#logging.debug(str(self.comment_w))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ExceptionStream:
-				logging.debug('Found ExceptionStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.exception = ExceptionList.parse(dir, self.file_handle)
-				#logging.debug(str(self.comment_w))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.HandleDataStream:
-				logging.debug('Found HandleDataStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.handles = MinidumpHandleDataStream.parse(dir, self.file_handle)
-				#logging.debug(str(self.handles))
-				continue
-
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.FunctionTableStream:
-				logging.debug('Found FunctionTableStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				logging.debug('Parsing of this stream type is not yet implemented!')
-				continue
-
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.UnloadedModuleListStream:
-				logging.debug('Found UnloadedModuleListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.unloaded_modules = MinidumpUnloadedModuleList.parse(dir, self.file_handle)
-				#logging.debug(str(self.unloaded_modules))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.MiscInfoStream:
-				logging.debug('Found MiscInfoStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.misc_info = MinidumpMiscInfo.parse(dir, self.file_handle)
-				#logging.debug(str(self.misc_info))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.MemoryInfoListStream:
-				logging.debug('Found MemoryInfoListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.memory_info = MinidumpMemoryInfoList.parse(dir, self.file_handle)
-				#logging.debug(str(self.memory_info))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ThreadInfoListStream:
-				logging.debug('Found ThreadInfoListStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				self.thread_info = MinidumpThreadInfoList.parse(dir, self.file_handle)
-				logging.debug(str(self.thread_info))
-				continue
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.SystemMemoryInfoStream:
-				logging.debug('Found SystemMemoryInfoStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				logging.debug('SystemMemoryInfoStream parsing is not implemented (Missing documentation)')
-				continue
-
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.JavaScriptDataStream:
-				logging.debug('Found JavaScriptDataStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				logging.debug('JavaScriptDataStream parsing is not implemented (Missing documentation)')
-
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.ProcessVmCountersStream:
-				logging.debug('Found ProcessVmCountersStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				logging.debug('ProcessVmCountersStream parsing is not implemented (Missing documentation)')
-
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.TokenStream:
-				logging.debug('Found TokenStream @%x Size: %d' % (dir.Location.Rva, dir.Location.DataSize))
-				logging.debug('TokenStream parsing is not implemented (Missing documentation)')
+			elif debug:
+				if dir.StreamType in self._UNIMPLEMENTED_STREAMS:
+					logger.debug('%s parsing is not implemented', dir.StreamType.name)
+				else:
+					logger.debug('Found Unknown Stream! Type: %s @%x Size: %d', dir.StreamType.name, dir.Location.Rva, dir.Location.DataSize)
+
+		if not self.eager:
+			# streams get parsed on first access, see _parse_stream
+			return
 
-			else:
-				logging.debug('Found Unknown Stream! Type: %s @%x Size: %d' % (dir.StreamType.name, dir.Location.Rva, dir.Location.DataSize))
+		if self.max_workers > 1 and len(jobs) > 1 and self.raw_file_handle is not None:
+			self.__parse_streams_concurrently(jobs)
+		else:
+			for dir, (attr_name, parser) in jobs:
+				setattr(self, attr_name, parser(dir, self.file_handle))
 
-			"""
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.HandleOperationListStream:
-			elif dir.StreamType == MINIDUMP_STREAM_TYPE.LastReservedStream:
+		# streams not present in the dump
+		for attr_name, _ in self._STREAM_PARSERS.values():
+			self._streams.setdefault(attr_name, None)
 
-			"""
 		try:
 			self.__parse_thread_context()
 		except Exception as e:
-			logging.exception('Thread context parsing error!')
+			logger.exception('Thread context parsing error!')
+
+	def _parse_stream(self, attr_name):
+		dir = self._stream_directories.get(attr_name)
+		if dir is None:
+			return None
+		_, parser = self._STREAM_PARSERS[dir.StreamType]
+		stream = parser(dir, self.file_handle)
+		if attr_name == 'threads':
+			# cache it first, context parsing reads the thread list back
+			self._streams[attr_name] = stream
+			try:
+				self.__parse_thread_context()
+			except Exception as e:
+				logger.exception('Thread context parsing error!')
+		return stream
+
+	def __parse_streams_concurrently(self, jobs):
+		def parse_stream(dir, parser):
+			# the parsers seek around in the handle, so every job gets its own file object.
+			# file reads release the GIL (copying out of a mapping doesn't), that's what lets the jobs overlap
+			with open(self.filename, 'rb') as f:
+				return parser(dir, f)
+
+		with ThreadPoolExecutor(max_workers = min(self.max_workers, len(jobs))) as executor:
+			futures = [(attr_name, executor.submit(parse_stream, dir, parser)) for dir, (attr_name, parser) in jobs]
+			for attr_name, future in futures:
+				setattr(self, attr_name, future.result())
 
 	def __parse_thread_context(self):
 		if not self.sysinfo or not self.threads:
 			return
+		if self.sysinfo.ProcessorArchitecture == PROCESSOR_ARCHITECTURE.AMD64:
+			context_type = CONTEXT
+		elif self.sysinfo.ProcessorArchitecture == PROCESSOR_ARCHITECTURE.INTEL:
+			context_type = WOW64_CONTEXT
+		else:
+			return
 		for thread in self.threads.threads:
-			rva = thread.ThreadContext.Rva
-			self.file_handle.seek(rva)
-			if self.sysinfo.ProcessorArchitecture == PROCESSOR_ARCHITECTURE.AMD64:
-				thread.ContextObject = CONTEXT.parse(self.file_handle)
-			elif self.sysinfo.ProcessorArchitecture == PROCESSOR_ARCHITECTURE.INTEL:
-				thread.ContextObject = WOW64_CONTEXT.parse(self.file_handle)
+			self.file_handle.seek(thread.ThreadContext.Rva)
+			thread.ContextObject = context_type.parse(self.file_handle)
 
 
 	def __str__(self):
-		t = '== Minidump File ==\n'
-		t += str(self.header)
-		t += str(self.sysinfo)
-		for dir in self.directories:
-			t += str(dir) + '\n'
-		for mod in self.modules.modules:
-			t += str(mod) + '\n'
+		parts = ['== Minidump File ==\n', str(self.header), str(self.sysinfo)]
+		parts.extend(str(dir) + '\n' for dir in self.directories)
+		parts.extend(str(mod) + '\n' for mod in self.modules.modules)
 		if self.memory_segments is not None:
-			for segment in self.memory_segments.memory_segments:
-				t+= str(segment) + '\n'
+			parts.extend(str(segment) + '\n' for segment in self.memory_segments.memory_segments)
 
 		if self.memory_segments_64 is not None:
-			for segment in self.memory_segments_64.memory_segments:
-				t+= str(segment) + '\n'
+			parts.extend(str(segment) + '\n' for segment in self.memory_segments_64.memory_segments)
 
-		return t
+		return ''.join(parts)
@@ -42,14 +42,13 @@ class MinidumpBufferedMemorySegment:
 		data = self.read(file_handle, 0, -1)
 		return data.find(pattern, startpos)
 
-	def read(self, file_handle, start, end):
-		if end is None:
-			file_handle.seek(self.start_file_address + start)
-			return file_handle.read(self.end_address - (self.start_file_address + start))
-
+	def get_chunk(self, file_handle, start, end):
+		"""
+		Returns the cached chunk covering the [start, end) segment-relative range, loading it from the file if needed
+		"""
 		for chunk in self.chunks:
 			if chunk.inrange(start, end):
-				return chunk.data[start - chunk.start: end - chunk.start]
+				return chunk
 
 		if self.total_size <= 2*self.chunksize:
 			chunksize = self.total_size
@@ -57,7 +56,7 @@ class MinidumpBufferedMemorySegment:
 			file_handle.seek(self.start_file_address)
 			vs.data = file_handle.read(chunksize)
 			self.chunks.append(vs)
-			return vs.data[start - vs.start: end - vs.start]
+			return vs
 
 		chunksize = max((end-start), self.chunksize)
 		if start + chunksize > self.end_address:
@@ -67,8 +66,22 @@ class MinidumpBufferedMemorySegment:
 		file_handle.seek(vs.start_file_address)
 		vs.data = file_handle.read(chunksize)
 		self.chunks.append(vs)
+		return vs
+
+	def read(self, file_handle, start, end):
+		if end is None:
+			file_handle.seek(self.start_file_address + start)
+			return file_handle.read(self.end_address - (self.start_file_address + start))
 
-		return vs.data[start - vs.start: end - vs.start]
+		chunk = self.get_chunk(file_handle, start, end)
+		return chunk.data[start - chunk.start: end - chunk.start]
+
+	def read_view(self, file_handle, start, end):
+		"""
+		Same as read, but returns a memoryview over the cached chunk instead of copying the data
+		"""
+		chunk = self.get_chunk(file_handle, start, end)
+		return memoryview(chunk.data)[start - chunk.start: end - chunk.start]
 
 
 
@@ -190,6 +203,20 @@ class MinidumpBufferedReader:
 		self.current_position = t
 		return self.current_segment.read(self.reader.file_handle, old_new_pos - self.current_segment.start_address, t - self.current_segment.start_address)
 
+	def get_memoryview(self, address, length):
+		"""
+		Moves to the virtual address and returns a memoryview of length bytes from the current segment.
+		The view points into the reader's cache, no copy is made.
+		"""
+		self.move(address)
+		t = self.current_position + length
+		if not self.current_segment.inrange(t - 1):
+			raise Exception('Would read over segment boundaries!')
+
+		old_new_pos = self.current_position
+		self.current_position = t
+		return self.current_segment.read_view(self.reader.file_handle, old_new_pos - self.current_segment.start_address, t - self.current_segment.start_address)
+
 	def read_int(self):
 		"""
 		Reads an integer. The size depends on the architecture.
@@ -1,4 +1,37 @@
 #!/usr/bin/env python3
+import struct
+
+# precompiled layouts, so fixed size register blocks are unpacked in one call instead of field by field
+_M128A = struct.Struct('<Qq')
+_XMM_SAVE_AREA32_HEADER = struct.Struct('<HHBBHIHHIHHII')
+_CONTEXT_HEADER = struct.Struct('<6Q2I6HI6Q17Q')
+_CONTEXT_HEADER_FIELDS = (
+    'P1Home', 'P2Home', 'P3Home', 'P4Home', 'P5Home', 'P6Home',
+    'ContextFlags', 'MxCsr',
+    'SegCs', 'SegDs', 'SegEs', 'SegFs', 'SegGs', 'SegSs',
+    'EFlags',
+    'Dr0', 'Dr1', 'Dr2', 'Dr3', 'Dr6', 'Dr7',
+    'Rax', 'Rcx', 'Rdx', 'Rbx', 'Rsp', 'Rbp', 'Rsi', 'Rdi',
+    'R8', 'R9', 'R10', 'R11', 'R12', 'R13', 'R14', 'R15', 'Rip',
+)
+_CONTEXT_TRAILER = struct.Struct('<6Q')
+_WOW64_CONTEXT_DEBUG = struct.Struct('<7I')
+_WOW64_CONTEXT_INTEGER = struct.Struct('<16I')
+_WOW64_CONTEXT_INTEGER_FIELDS = (
+    'SegGs', 'SegFs', 'SegEs', 'SegDs',
+    'Edi', 'Esi', 'Ebx', 'Edx', 'Ecx', 'Eax',
+    'Ebp', 'Eip', 'SegCs', 'EFlags', 'Esp', 'SegSs',
+)
+_WOW64_FLOATING_SAVE_AREA_HEADER = struct.Struct('<7I')
+_U64_ARRAY32 = struct.Struct('<32Q')
+_U32_ARRAY32 = struct.Struct('<32I')
+
+def _read(buff, size):
+    # contexts may sit at the very end of the file, missing bytes are treated as zeroes
+    data = buff.read(size)
+    if len(data) < size:
+        data += b'\x00' * (size - len(data))
+    return data
 
 # https://www.vergiliusproject.com/kernels/x64/Windows%2010%20%7C%202016/1507%20Threshold%201/_M128A
 class M128A:
@@ -9,17 +42,17 @@ class M128A:
     @classmethod
     def parse(cls, buff):
         m128a = cls()
-
-        m128a.Low = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)
-        m128a.High = int.from_bytes(buff.read(8), byteorder = 'little', signed = True)
-
+        m128a.Low, m128a.High = _M128A.unpack(_read(buff, _M128A.size))
         return m128a
 
     @classmethod
     def parse_array(cls, buff, length):
         arr = []
-        for i in range(length):
-            arr.append(cls.parse(buff))
+        for low, high in _M128A.iter_unpack(_read(buff, _M128A.size * length)):
+            m128a = cls()
+            m128a.Low = low
+            m128a.High = high
+            arr.append(m128a)
         return arr
 
     def __str__(self):
@@ -59,25 +92,16 @@ class XMM_SAVE_AREA32:
     def parse(cls, buff):
         xmm = cls()
 
-        xmm.ControlWord = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)
-        xmm.StatusWord = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)
-        xmm.TagWord = chr(int.from_bytes(buff.read(1), byteorder = 'little', signed = False))
-        xmm.Reserved1 = chr(int.from_bytes(buff.read(1), byteorder = 'little', signed = False))
-        xmm.ErrorOpcode = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)
-        xmm.ErrorOffset = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        xmm.ErrorSelector = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)
-        xmm.Reserved2 = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)
-        xmm.DataOffset = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        xmm.DataSelector = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)
-        xmm.Reserved3 = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)
-        xmm.MxCsr = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        xmm.MxCsr_Mask = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
+        (
+            xmm.ControlWord, xmm.StatusWord, tag_word, reserved1,
+            xmm.ErrorOpcode, xmm.ErrorOffset, xmm.ErrorSelector, xmm.Reserved2,
+            xmm.DataOffset, xmm.DataSelector, xmm.Reserved3, xmm.MxCsr, xmm.MxCsr_Mask,
+        ) = _XMM_SAVE_AREA32_HEADER.unpack(_read(buff, _XMM_SAVE_AREA32_HEADER.size))
+        xmm.TagWord = chr(tag_word)
+        xmm.Reserved1 = chr(reserved1)
         xmm.FloatRegisters = M128A.parse_array(buff, 8)
         xmm.XmmRegisters = M128A.parse_array(buff, 16)
-        xmm.Reserved4 = [
-            chr(int.from_bytes(buff.read(1), byteorder = 'little', signed = False))
-            for i in range(96)
-        ]
+        xmm.Reserved4 = [chr(b) for b in _read(buff, 96)]
 
         return xmm
 
@@ -196,15 +220,9 @@ class CTX_DUMMYUNIONNAME:
 
         dun.FltSave = XMM_SAVE_AREA32.parse(buff)
         dun.Q = NEON128.parse_array(buff, 16)
-        dun.D = [
-            int.from_bytes(buff.read(8), byteorder = 'little', signed = False)
-            for i in range(32)
-        ]
+        dun.D = list(_U64_ARRAY32.unpack(_read(buff, _U64_ARRAY32.size)))
         dun.DUMMYSTRUCTNAME = CTX_DUMMYSTRUCTNAME.parse(buff)
-        dun.S = [
-            int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-            for i in range(32)
-        ]
+        dun.S = list(_U32_ARRAY32.unpack(_read(buff, _U32_ARRAY32.size)))
         return dun
 
     def __str__(self):
@@ -278,53 +296,16 @@ class CONTEXT:
     def parse(cls, buff):
         ctx = cls()
 
-        ctx.P1Home = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.P2Home = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.P3Home = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.P4Home = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.P5Home = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.P6Home = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.ContextFlags = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)   # DWORD
-        ctx.MxCsr = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)   # DWORD
-        ctx.SegCs = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)   # WORD
-        ctx.SegDs = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)   # WORD
-        ctx.SegEs = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)   # WORD
-        ctx.SegFs = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)   # WORD
-        ctx.SegGs = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)   # WORD
-        ctx.SegSs = int.from_bytes(buff.read(2), byteorder = 'little', signed = False)   # WORD
-        ctx.EFlags = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)   # DWORD
-        ctx.Dr0 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Dr1 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Dr2 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Dr3 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Dr6 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Dr7 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rax = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rcx = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rdx = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rbx = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rsp = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rbp = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rsi = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rdi = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R8 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R9 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R10 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R11 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R12 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R13 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R14 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.R15 = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.Rip = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
+        for name, value in zip(_CONTEXT_HEADER_FIELDS, _CONTEXT_HEADER.unpack(_read(buff, _CONTEXT_HEADER.size))):
+            setattr(ctx, name, value)
         ctx.DUMMYUNIONNAME = CTX_DUMMYUNIONNAME.parse(buff)
 
         ctx.VectorRegister = M128A.parse_array(buff, 26)         # M128A   [26]
-        ctx.VectorControl =  int.from_bytes(buff.read(8), byteorder = 'little', signed = False)       # DWORD64
-        ctx.DebugControl = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)         # DWORD64
-        ctx.LastBranchToRip = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)      # DWORD64
-        ctx.LastBranchFromRip = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)    # DWORD64
-        ctx.LastExceptionToRip = int.from_bytes(buff.read(8), byteorder = 'little', signed = False)   # DWORD64
-        ctx.LastExceptionFromRip = int.from_bytes(buff.read(8), byteorder = 'little', signed = False) # DWORD64
+        (
+            ctx.VectorControl, ctx.DebugControl,
+            ctx.LastBranchToRip, ctx.LastBranchFromRip,
+            ctx.LastExceptionToRip, ctx.LastExceptionFromRip,
+        ) = _CONTEXT_TRAILER.unpack(_read(buff, _CONTEXT_TRAILER.size))
 
         return ctx
 
@@ -390,13 +371,10 @@ class WOW64_FLOATING_SAVE_AREA:
     @classmethod
     def parse(cls, buff):
         ctx = cls()
-        ctx.ControlWord = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.StatusWord = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.TagWord = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.ErrorOffset = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.ErrorSelector = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.DataOffset = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.DataSelector = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
+        (
+            ctx.ControlWord, ctx.StatusWord, ctx.TagWord, ctx.ErrorOffset,
+            ctx.ErrorSelector, ctx.DataOffset, ctx.DataSelector,
+        ) = _WOW64_FLOATING_SAVE_AREA_HEADER.unpack(_read(buff, _WOW64_FLOATING_SAVE_AREA_HEADER.size))
         ctx.RegisterArea = int.from_bytes(buff.read(80), byteorder = 'little', signed = False)
         ctx.Cr0NpxState = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
         return ctx
@@ -447,34 +425,13 @@ class WOW64_CONTEXT:
     def parse(cls, buff):
         ctx = cls()
 
-        ctx.ContextFlags = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Dr0 = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Dr1 = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Dr2 = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Dr3 = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Dr6 = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Dr7 = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
+        (
+            ctx.ContextFlags, ctx.Dr0, ctx.Dr1, ctx.Dr2, ctx.Dr3, ctx.Dr6, ctx.Dr7,
+        ) = _WOW64_CONTEXT_DEBUG.unpack(_read(buff, _WOW64_CONTEXT_DEBUG.size))
         ctx.FloatSave = WOW64_FLOATING_SAVE_AREA.parse(buff)
-        ctx.SegGs = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.SegFs = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.SegEs = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.SegDs = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Edi = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Esi = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Ebx = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Edx = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Ecx = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Eax = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Ebp = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Eip = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.SegCs = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.EFlags = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.Esp = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.SegSs = int.from_bytes(buff.read(4), byteorder = 'little', signed = False)
-        ctx.ExtendedRegisters = [
-            int.from_bytes(buff.read(1), byteorder = 'little', signed = False)
-            for i in range(512)
-        ]
+        for name, value in zip(_WOW64_CONTEXT_INTEGER_FIELDS, _WOW64_CONTEXT_INTEGER.unpack(_read(buff, _WOW64_CONTEXT_INTEGER.size))):
+            setattr(ctx, name, value)
+        ctx.ExtendedRegisters = list(_read(buff, 512))
         return ctx
 
     def __str__(self):